@@ -13,47 +13,60 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.config_loader import load_config
 
 
+def _flush(lines):
+    """Write buffered report lines to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
 def main():
     """Load and display configuration."""
-    print("=" * 60)
-    print("TCG-Sentinel Configuration Test")
-    print("=" * 60)
-    print()
+    # Buffer the report and write it once rather than per line
+    lines = []
+    out = lines.append
+    
+    out("=" * 60)
+    out("TCG-Sentinel Configuration Test")
+    out("=" * 60)
+    out("")
     
     try:
         # Load configuration
-        print("Loading configuration...")
+        out("Loading configuration...")
         config = load_config()
-        print("✓ Configuration loaded successfully\n")
+        # Sections are parsed lazily; touch each so errors surface here
+        config.sources, config.keywords, config.routing, config.thresholds
+        out("✓ Configuration loaded successfully\n")
         
         # Display sources
-        print(f"Sources ({len(config.sources)} total, {len(config.get_enabled_sources())} enabled):")
-        print("-" * 60)
+        out(f"Sources ({len(config.sources)} total, {len(config.get_enabled_sources())} enabled):")
+        out("-" * 60)
         for source in config.sources:
             status = "✓" if source.enabled else "✗"
             interval_min = source.poll_interval / 60
-            print(f"{status} {source.name}")
-            print(f"  Type: {source.type}")
-            print(f"  URL: {source.url}")
-            print(f"  Parser: {source.parser_key}")
-            print(f"  Interval: {interval_min:.1f} minutes")
-            print(f"  Tags: {', '.join(source.tags)}")
+            out(f"{status} {source.name}")
+            out(f"  Type: {source.type}")
+            out(f"  URL: {source.url}")
+            out(f"  Parser: {source.parser_key}")
+            out(f"  Interval: {interval_min:.1f} minutes")
+            out(f"  Tags: {', '.join(source.tags)}")
             if source.description:
-                print(f"  Description: {source.description}")
-            print()
+                out(f"  Description: {source.description}")
+            out("")
         
         # Display keywords
-        print(f"\nKeywords:")
-        print("-" * 60)
-        print(f"Allowlist: {len(config.keywords['allowlist'])} keywords")
-        print(f"  Examples: {', '.join(config.keywords['allowlist'][:5])}")
-        print(f"Blocklist: {len(config.keywords['blocklist'])} keywords")
-        print(f"  Examples: {', '.join(config.keywords['blocklist'][:5])}")
-        print()
+        out(f"\nKeywords:")
+        out("-" * 60)
+        out(f"Allowlist: {len(config.keywords['allowlist'])} keywords")
+        out(f"  Examples: {', '.join(config.keywords['allowlist'][:5])}")
+        out(f"Blocklist: {len(config.keywords['blocklist'])} keywords")
+        out(f"  Examples: {', '.join(config.keywords['blocklist'][:5])}")
+        out("")
         
         # Test keyword matching
-        print("\nKeyword Matching Tests:")
-        print("-" * 60)
+        out("\nKeyword Matching Tests:")
+        out("-" * 60)
         test_cases = [
             ("Pokemon TCG Booster Box", True),
             ("Elite Trainer Box Scarlet Violet", True),
@@ -66,22 +79,22 @@ def main():
             result = config.has_keyword_match(text)
             status = "✓" if result == expected else "✗"
             match_str = "MATCH" if result else "NO MATCH"
-            print(f"{status} '{text}' -> {match_str}")
-        print()
+            out(f"{status} '{text}' -> {match_str}")
+        out("")
         
         # Display routing
-        print("\nAlert Routing:")
-        print("-" * 60)
+        out("\nAlert Routing:")
+        out("-" * 60)
         for alert_type, routing in config.routing.items():
             telegram = "✓" if routing.get("telegram") else "✗"
             discord = routing.get("discord", "none")
             priority = routing.get("priority", "normal")
-            print(f"{alert_type:20s} -> Telegram:{telegram} Discord:{discord} Priority:{priority}")
-        print()
+            out(f"{alert_type:20s} -> Telegram:{telegram} Discord:{discord} Priority:{priority}")
+        out("")
         
         # Display thresholds
-        print("\nThresholds:")
-        print("-" * 60)
+        out("\nThresholds:")
+        out("-" * 60)
         cooldowns = config.thresholds.get("cooldowns", {})
         for alert_type, seconds in cooldowns.items():
             if seconds == 0:
@@ -92,47 +105,51 @@ def main():
                 cooldown_str = f"{seconds / 3600:.1f} hours"
             else:
                 cooldown_str = f"{seconds / 86400:.1f} days"
-            print(f"{alert_type:20s}: {cooldown_str}")
+            out(f"{alert_type:20s}: {cooldown_str}")
         
         price_threshold = config.thresholds.get("price_drop_threshold", 0)
-        print(f"\nPrice drop threshold: {price_threshold * 100:.0f}%")
+        out(f"\nPrice drop threshold: {price_threshold * 100:.0f}%")
         
         max_alerts = config.thresholds.get("max_alerts_per_hour", 0)
-        print(f"Max alerts per hour: {max_alerts}")
+        out(f"Max alerts per hour: {max_alerts}")
         
         # Geo filter
         geo_filter = config.thresholds.get("geo_filter", {})
         if geo_filter.get("enabled"):
             counties = geo_filter.get("allowed_counties", [])
-            print(f"\nGeo filtering: Enabled")
-            print(f"Allowed counties: {', '.join(counties)}")
-        print()
+            out(f"\nGeo filtering: Enabled")
+            out(f"Allowed counties: {', '.join(counties)}")
+        out("")
         
         # Environment variables (without showing secrets)
-        print("\nEnvironment Variables:")
-        print("-" * 60)
+        out("\nEnvironment Variables:")
+        out("-" * 60)
         telegram_status = "✓ Set" if config.telegram_token else "✗ Not set"
         discord_stock_status = "✓ Set" if config.discord_webhook_stock else "✗ Not set"
         discord_events_status = "✓ Set" if config.discord_webhook_events else "✗ Not set"
         
-        print(f"TELEGRAM_BOT_TOKEN: {telegram_status}")
-        print(f"TELEGRAM_CHAT_ID: {'✓ Set' if config.telegram_chat_id else '✗ Not set'}")
-        print(f"DISCORD_WEBHOOK_STOCK: {discord_stock_status}")
-        print(f"DISCORD_WEBHOOK_EVENTS: {discord_events_status}")
-        print(f"LOG_LEVEL: {config.log_level}")
-        print(f"DATABASE_PATH: {config.database_path}")
-        print()
+        out(f"TELEGRAM_BOT_TOKEN: {telegram_status}")
+        out(f"TELEGRAM_CHAT_ID: {'✓ Set' if config.telegram_chat_id else '✗ Not set'}")
+        out(f"DISCORD_WEBHOOK_STOCK: {discord_stock_status}")
+        out(f"DISCORD_WEBHOOK_EVENTS: {discord_events_status}")
+        out(f"LOG_LEVEL: {config.log_level}")
+        out(f"DATABASE_PATH: {config.database_path}")
+        out("")
         
-        print("Configuration is valid and ready to use")
-        print("=" * 60)
+        out("Configuration is valid and ready to use")
+        out("=" * 60)
         
         return 0
         
     except Exception as e:
-        print(f"\n❌ Configuration error: {e}")
+        out(f"\n❌ Configuration error: {e}")
+        _flush(lines)  # Report goes out before the traceback
         import traceback
         traceback.print_exc()
         return 1
+    
+    finally:
+        _flush(lines)
 
 
 if __name__ == "__main__":
@@ -4,51 +4,62 @@ Quick validation script to test the environment setup.
 Run this to verify all dependencies are installed correctly.
 """
 
+import importlib.util
+import os
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-def test_imports():
+# (module name, display name) for each required package
+REQUIRED_MODULES = [
+    ("requests", "requests"),
+    ("bs4", "beautifulsoup4"),
+    ("yaml", "pyyaml"),
+    ("telegram", "python-telegram-bot"),
+    ("dateutil", "python-dateutil"),
+    ("pytest", "pytest"),
+    ("sqlite3", "sqlite3 (built-in)"),
+]
+
+def test_imports(out):
     """Test that all required packages can be imported."""
-    print("Testing imports...")
+    out("Testing imports...")
     
-    try:
-        import requests
-        print("✓ requests")
-        
-        import bs4
-        print("✓ beautifulsoup4")
-        
-        import yaml
-        print("✓ pyyaml")
-        
-        from dotenv import load_dotenv
-        print("✓ python-dotenv")
-        
-        import telegram
-        print("✓ python-telegram-bot")
-        
-        import dateutil
-        print("✓ python-dateutil")
-        
-        import pytest
-        print("✓ pytest")
-        
-        import sqlite3
-        print("✓ sqlite3 (built-in)")
-        
-        print("\nAll dependencies installed successfully!")
-        return True
-        
-    except ImportError as e:
-        print(f"\n❌ Import failed: {e}")
+    # find_spec locates each package without executing its top-level code
+    missing = []
+    for module_name, display_name in REQUIRED_MODULES:
+        if importlib.util.find_spec(module_name) is not None:
+            out(f"✓ {display_name}")
+        else:
+            out(f"✗ {display_name} (missing)")
+            missing.append(module_name)
+    
+    if missing:
+        out(f"\n❌ Import failed: missing {', '.join(missing)}")
         return False
+    
+    out("\nAll dependencies installed successfully!")
+    return True
+
+# Directory listings by parent path, so each parent is scanned only once
+_listings = {}
 
-def check_directory_structure():
+def _lookup_entry(path):
+    """Return the os.DirEntry for path from its parent's listing, or None."""
+    parent = path.parent
+    if parent not in _listings:
+        try:
+            with os.scandir(parent) as entries:
+                _listings[parent] = {entry.name: entry for entry in entries}
+        except OSError:
+            _listings[parent] = {}
+    return _listings[parent].get(path.name)
+
+def check_directory_structure(out):
     """Verify the project directory structure is correct."""
-    print("\nChecking directory structure...")
+    out("\nChecking directory structure...")
     
     base_dir = Path(__file__).parent.parent
     required_dirs = [
@@ -73,23 +84,23 @@ def check_directory_structure():
     
     all_exist = True
     for dir_path in required_dirs:
-        full_path = base_dir / dir_path
-        if full_path.exists():
-            print(f"✓ {dir_path}/")
+        entry = _lookup_entry(base_dir / dir_path)
+        if entry is not None and entry.is_dir():
+            out(f"✓ {dir_path}/")
         else:
-            print(f"✗ {dir_path}/ (missing)")
+            out(f"✗ {dir_path}/ (missing)")
             all_exist = False
     
     if all_exist:
-        print("\nAll directories are present")
+        out("\nAll directories are present")
     else:
-        print("\nSome directories are missing")
+        out("\nSome directories are missing")
     
     return all_exist
 
-def check_files():
+def check_files(out):
     """Check that essential files exist."""
-    print("\nChecking essential files...")
+    out("\nChecking essential files...")
     
     base_dir = Path(__file__).parent.parent
     required_files = [
@@ -101,40 +112,54 @@ def check_files():
     
     all_exist = True
     for file_path in required_files:
-        full_path = base_dir / file_path
-        if full_path.exists():
-            print(f"✓ {file_path}")
+        entry = _lookup_entry(base_dir / file_path)
+        if entry is not None and entry.is_file():
+            out(f"✓ {file_path}")
         else:
-            print(f"✗ {file_path} (missing)")
+            out(f"✗ {file_path} (missing)")
             all_exist = False
     
     if all_exist:
-        print("\nAll essential files present")
+        out("\nAll essential files present")
     else:
-        print("\nSome files are missing")
+        out("\nSome files are missing")
     
     return all_exist
 
+def _flush(lines):
+    """Write buffered report lines to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
 def main():
     """Run all validation checks."""
-    print("=" * 60)
-    print("TCG-Sentinel Environment Validation")
-    print("=" * 60)
-    print()
+    # Buffer the report and write it once rather than per line
+    lines = []
+    out = lines.append
     
-    results = [
-        test_imports(),
-        check_directory_structure(),
-        check_files(),
-    ]
+    try:
+        out("=" * 60)
+        out("TCG-Sentinel Environment Validation")
+        out("=" * 60)
+        out("")
+        
+        results = [
+            test_imports(out),
+            check_directory_structure(out),
+            check_files(out),
+        ]
+        
+        out("\n" + "=" * 60)
+        if all(results):
+            out("\nEnvironment setup complete\n")
+            return 0
+        else:
+            out("Some checks failed. Please review the output above.")
+            return 1
     
-    print("\n" + "=" * 60)
-    if all(results):
-        print("\nEnvironment setup complete\n")
-        return 0
-    else:
-        print("Some checks failed. Please review the output above.")
-        return 1
+    finally:
+        _flush(lines)
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,24 +1,367 @@
 """
 Configuration loader for TCG Sentinel.
 Loads and validates YAML configuration files.
+
+Config lives either in one file per section (sources.yaml, keywords.yaml,
+routing.yaml, thresholds.yaml) or in a single config.yaml with top-level
+sources/keywords/routing/thresholds keys. A section present in config.yaml
+takes precedence; one it leaves out is read from its own file.
 """
 
+import heapq
 import os
+import re
+import sys
+from collections import defaultdict
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 
 import yaml
-from dotenv import load_dotenv
 
 from src.models.source import Source
 
+# Prefer the libyaml-backed loader; same safety semantics as SafeLoader
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+COMBINED_CONFIG_FILE = "config.yaml"
+
+# (attribute, environment variable, default) for env-based settings
+_ENV_FIELDS = (
+    ("telegram_token", "TELEGRAM_BOT_TOKEN", None),
+    ("telegram_chat_id", "TELEGRAM_CHAT_ID", None),
+    ("discord_webhook_stock", "DISCORD_WEBHOOK_STOCK", None),
+    ("discord_webhook_events", "DISCORD_WEBHOOK_EVENTS", None),
+    ("log_level", "LOG_LEVEL", "INFO"),
+    ("database_path", "DATABASE_PATH", "data/tcg_sentinel.db"),
+)
+
+_ENV_FILE = Path(__file__).parent.parent / ".env"
+_env_loaded = False
+
+# .env values: "double" (with backslash escapes) or 'single' quoted, or a
+# " #" comment
+_ENV_QUOTED_VALUE = re.compile(rb"""(["'])((?:\\.|(?!\1).)*)\1""")
+_ENV_INLINE_COMMENT = re.compile(rb"\s+#")
+_ENV_ESCAPE = re.compile(rb"""\\([\\'"abfnrtv])""")
+_ENV_ESCAPES = {
+    b"\\": b"\\", b"'": b"'", b'"': b'"', b"a": b"\a", b"b": b"\b",
+    b"f": b"\f", b"n": b"\n", b"r": b"\r", b"t": b"\t", b"v": b"\v",
+}
+
+# Up to this many keywords in total, generated 'in' chains beat the
+# automaton/regex scans
+_INLINE_KEYWORD_LIMIT = 16
+
+# Returned by Config._load_prebuilt when the YAML itself must be parsed
+_NOT_PREBUILT = object()
+
+# Start of a top-level YAML line: anything but indentation, comments, blanks
+# and "- item" entries (a block sequence may sit in column 0 under its key)
+_TOP_LEVEL_LINE = re.compile(rb"^(?!-(?:\s|$))[^\s#]", re.MULTILINE)
+
+# Optional: orjson is several times faster than the stdlib for JSON mirrors
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        # Dates must raise rather than quietly become strings
+        return orjson.dumps(data, option=orjson.OPT_PASSTHROUGH_DATETIME)
+except ImportError:
+    import json
+    _json_loads = json.loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+# Optional: multi-pattern keyword matching in a single pass over the text
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Without pyahocorasick, fall back to one alternation regex per keyword list;
+# google-re2 compiles it to a DFA, the stdlib scans it in C either way
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+
+def _parse_env_value(value: bytes) -> bytes:
+    """
+    Parse the right-hand side of a .env line.
+    
+    Quoted values run up to the closing quote, and double-quoted ones have
+    their backslash escapes decoded; unquoted values end at a " #" comment,
+    which may take up the whole value.
+    """
+    quoted = _ENV_QUOTED_VALUE.match(value.lstrip())
+    if quoted is not None:
+        text = quoted.group(2)
+        if quoted.group(1) == b'"':
+            return _ENV_ESCAPE.sub(lambda m: _ENV_ESCAPES[m.group(1)], text)
+        return text
+    
+    comment = _ENV_INLINE_COMMENT.search(value)
+    if comment is not None:
+        value = value[:comment.start()]
+    return value.strip()
+
+
+def _load_env_once() -> None:
+    """
+    Load KEY=VALUE pairs from the project .env file into os.environ.
+    
+    Existing environment variables take precedence. The file is read at
+    most once per process; a missing .env is not an error.
+    
+    Unlike python-dotenv, ${VAR} references are kept literally rather than
+    expanded, and values cannot span several lines.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    
+    try:
+        raw = _ENV_FILE.read_bytes()
+    except OSError:
+        return
+    
+    for line in raw.split(b"\n"):
+        line = line.strip()
+        if not line or line.startswith(b"#"):
+            continue
+        if line.startswith(b"export "):
+            line = line[7:]
+        key, sep, value = line.partition(b"=")
+        if not sep:
+            continue
+        value = _parse_env_value(value)
+        os.environ.setdefault(key.strip().decode("utf-8"), value.decode("utf-8"))
+
+
+def _parse_yaml(stream: BinaryIO) -> Any:
+    """Parse a whole YAML document into Python objects."""
+    return yaml.load(stream, Loader=_Loader)
+
+
+# Tag resolution for scalars read straight off the event stream
+_RESOLVER = yaml.resolver.Resolver()
+_NULL_TAG = "tag:yaml.org,2002:null"
+_STR_TAG = "tag:yaml.org,2002:str"
+
+
+def _construct_scalar(tag: str, event: yaml.ScalarEvent) -> Any:
+    """Build the Python value the safe loader would for a scalar event."""
+    node = yaml.ScalarNode(tag, event.value, style=event.style)
+    construct = yaml.SafeLoader.yaml_constructors.get(
+        tag, yaml.SafeLoader.yaml_constructors[None])
+    return construct(yaml.SafeLoader(""), node)
+
+
+def _parse_keyword_lists(stream: BinaryIO) -> Dict[str, List[str]]:
+    """
+    Extract the allowlist/blocklist from keywords.yaml.
+    
+    Walks the parser's event stream and appends keyword scalars straight
+    into the result lists, skipping the intermediate document tree.
+    Null items are skipped. Falls back to a full parse if the file uses
+    aliases.
+    
+    Args:
+        stream: keywords.yaml opened in binary mode
+        
+    Returns:
+        Dictionary with 'allowlist' and 'blocklist' keys
+    """
+    lists: Dict[str, List[str]] = {"allowlist": [], "blocklist": []}
+    depth = 0
+    expect_key = True
+    key = None
+    target = None
+    
+    for event in yaml.parse(stream, Loader=_Loader):
+        if isinstance(event, yaml.ScalarEvent):
+            if depth == 1:
+                if expect_key:
+                    key = event.value
+                expect_key = not expect_key
+            elif depth == 2 and target is not None:
+                # Resolve like the safe loader would: '-', '~' and 'null' items
+                # are skipped, and numbers/bools come out typed, exactly as
+                # from a full parse of the same list
+                tag = event.tag or _RESOLVER.resolve(yaml.ScalarNode, event.value, event.implicit)
+                if tag == _STR_TAG:
+                    target.append(event.value)
+                elif tag != _NULL_TAG:
+                    target.append(_construct_scalar(tag, event))
+        elif isinstance(event, yaml.CollectionStartEvent):
+            if depth == 1:
+                # A collection at depth 1 is always a top-level value
+                if isinstance(event, yaml.SequenceStartEvent):
+                    target = lists.get(key)
+                expect_key = True
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+            if depth == 1:
+                target = None
+        elif isinstance(event, yaml.AliasEvent):
+            # Anchored lists need the composer to resolve them
+            stream.seek(0)
+            data = _parse_yaml(stream) or {}
+            return {name: data.get(name) or [] for name in lists}
+    
+    return lists
+
+
+def _lower_keyword_lists(data: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Lowercase the allowlist/blocklist of an already-parsed document.
+    
+    Non-string keywords (e.g. "- 151") are matched by their text. Null and
+    empty keywords are dropped: they would match every title, and the
+    matcher backends can't agree on them (Aho-Corasick ignores them).
+    """
+    lists = {}
+    for name in ("allowlist", "blocklist"):
+        lowered = (str(kw).lower() for kw in data.get(name) or [] if kw is not None)
+        lists[name] = [kw for kw in lowered if kw]
+    return lists
+
+
+def _intern(value: Any) -> Any:
+    """Intern value if it is a string; return anything else unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_keys(value: Any) -> Any:
+    """Recursively intern the keys of (nested) dictionaries."""
+    if isinstance(value, dict):
+        return {_intern(k): _intern_keys(v) for k, v in value.items()}
+    return value
+
+
+def _build_automaton(words: List[str]):
+    """
+    Build an Aho-Corasick automaton matching any of the given words.
+    
+    Args:
+        words: Lowercased keywords
+        
+    Returns:
+        Automaton, or None if pyahocorasick is missing or words is empty
+    """
+    if ahocorasick is None or not words:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    if not len(automaton):
+        return None  # Only empty words; add_word() ignores those
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_regex(words: List[str]):
+    """
+    Compile a regex matching any of the given words literally.
+    
+    Args:
+        words: Lowercased keywords
+        
+    Returns:
+        Compiled pattern, or None if words is empty
+    """
+    if not words:
+        return None
+    return _regex.compile("|".join(map(re.escape, words)))
+
+
+def _compile_inline_matcher(allowlist: List[str],
+                            blocklist: List[str]) -> Callable[[str], bool]:
+    """
+    Generate a matcher with every keyword inlined as a constant 'in' test.
+    
+    Args:
+        allowlist: Lowercased allowlist keywords
+        blocklist: Lowercased blocklist keywords
+        
+    Returns:
+        Function taking lowercased text and returning the match result
+    """
+    # repr() always yields a valid string literal, whatever the keyword holds
+    blocked = " or ".join(f"{kw!r} in t" for kw in blocklist)
+    allowed = " or ".join(f"{kw!r} in t" for kw in allowlist) or "False"
+    
+    lines = ["def match(t):"]
+    if blocked:
+        lines += [f"    if {blocked}:", "        return False"]
+    lines.append(f"    return {allowed}")
+    
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), "<keyword_match>", "exec"), namespace)
+    return namespace["match"]
+
+
+def _build_matcher(allowlist: List[str],
+                   blocklist: List[str]) -> Callable[[str], bool]:
+    """
+    Build the fastest available keyword matcher for the given lists.
+    
+    Small keyword sets are inlined into generated code; larger ones use
+    Aho-Corasick automatons, or one regex per list without pyahocorasick.
+    
+    Args:
+        allowlist: Lowercased allowlist keywords
+        blocklist: Lowercased blocklist keywords
+        
+    Returns:
+        Function taking lowercased text and returning the match result
+    """
+    if len(allowlist) + len(blocklist) <= _INLINE_KEYWORD_LIMIT:
+        return _compile_inline_matcher(allowlist, blocklist)
+    
+    if ahocorasick is not None:
+        allow_ac = _build_automaton(allowlist)
+        block_ac = _build_automaton(blocklist)
+        
+        def match(text_lower: str) -> bool:
+            # One scan per automaton, stopping at the first hit
+            if block_ac is not None and next(block_ac.iter(text_lower), None) is not None:
+                return False
+            return allow_ac is not None and next(allow_ac.iter(text_lower), None) is not None
+        
+        return match
+    
+    allow_re = _build_regex(allowlist)
+    block_re = _build_regex(blocklist)
+    
+    def match(text_lower: str) -> bool:
+        # Check blocklist first (faster rejection)
+        if block_re is not None and block_re.search(text_lower) is not None:
+            return False
+        return allow_re is not None and allow_re.search(text_lower) is not None
+    
+    return match
+
 
 class Config:
     """Main configuration container for the application."""
     
     def __init__(self, config_dir: Path = None):
         """
-        Initialize configuration from YAML files.
+        Initialize configuration.
+        
+        Environment settings are read immediately; each YAML-backed section
+        is parsed on first access.
         
         Args:
             config_dir: Path to config directory (defaults to ./config)
@@ -31,28 +374,41 @@ class Config:
         self.config_dir = Path(config_dir)
         
         # Load environment variables
-        load_dotenv()
-        
-        # Load all configuration files
-        self.sources: List[Source] = self._load_sources()
-        self.keywords: Dict[str, List[str]] = self._load_keywords()
-        self.routing: Dict[str, Any] = self._load_routing()
-        self.thresholds: Dict[str, Any] = self._load_thresholds()
+        _load_env_once()
         
         # Environment-based settings
-        self.telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
-        self.telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID")
-        self.discord_webhook_stock = os.getenv("DISCORD_WEBHOOK_STOCK")
-        self.discord_webhook_events = os.getenv("DISCORD_WEBHOOK_EVENTS")
-        self.log_level = os.getenv("LOG_LEVEL", "INFO")
-        self.database_path = os.getenv("DATABASE_PATH", "data/tcg_sentinel.db")
+        env = os.environ
+        for attr, key, default in _ENV_FIELDS:
+            setattr(self, attr, env.get(key, default))
+    
+    @cached_property
+    def sources(self) -> List[Source]:
+        """Configured sources, loaded from sources.yaml on first access."""
+        return self._load_sources()
+    
+    @cached_property
+    def keywords(self) -> Dict[str, List[str]]:
+        """Keyword filters, loaded from keywords.yaml on first access."""
+        return self._load_keywords()
+    
+    @cached_property
+    def routing(self) -> Dict[str, Any]:
+        """Alert routing, loaded from routing.yaml on first access."""
+        return self._load_routing()
     
-    def _load_yaml(self, filename: str) -> Dict[str, Any]:
+    @cached_property
+    def thresholds(self) -> Dict[str, Any]:
+        """Thresholds, loaded from thresholds.yaml on first access."""
+        return self._load_thresholds()
+    
+    def _load_yaml(self, filename: str,
+                   parse: Callable[[BinaryIO], Any] = _parse_yaml) -> Dict[str, Any]:
         """
         Load a YAML file from the config directory.
         
         Args:
             filename: Name of the YAML file (e.g., "sources.yaml")
+            parse: Parser applied to the file on a cache miss
             
         Returns:
             Parsed YAML data as dictionary
@@ -63,11 +419,155 @@ class Config:
         """
         file_path = self.config_dir / filename
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"Config file not found: {file_path}")
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {file_path}") from None
+        
+        data = self._load_prebuilt(file_path, stat, parse)
+        if data is not _NOT_PREBUILT:
+            return data
+        
+        # libyaml decodes UTF-8 itself, so hand it raw bytes
+        with open(file_path, 'rb') as f:
+            data = parse(f)
+        
+        cache_path = self.config_dir / ".cache" / self._cache_name(filename, parse)
+        self._write_cache(cache_path, [stat.st_mtime_ns, stat.st_size], data)
+        return data
+    
+    def _load_prebuilt(self, file_path: Path, stat: os.stat_result,
+                       parse: Callable[[BinaryIO], Any] = _parse_yaml) -> Any:
+        """
+        Load already-parsed data for a YAML file without parsing it.
+        
+        Args:
+            file_path: Path of the YAML file
+            stat: Current stat of the YAML file
+            parse: Parser whose cache entry to look up
+            
+        Returns:
+            Data from a current JSON mirror or parse cache entry, or
+            _NOT_PREBUILT if there is neither
+        """
+        # JSON loads far faster than YAML: prefer a current JSON mirror
+        # shipped next to the file
+        mirror_path = file_path.with_name(file_path.name + ".json")
+        try:
+            if mirror_path.stat().st_mtime_ns >= stat.st_mtime_ns:
+                return _json_loads(mirror_path.read_bytes())
+        except (OSError, ValueError):
+            pass  # Missing or unreadable mirror - try the cache
+        
+        # Our own parse cache is only valid for the exact file it was built
+        # from; mtime ordering alone misses same-second edits and restores
+        cache_path = self.config_dir / ".cache" / self._cache_name(file_path.name, parse)
+        try:
+            entry = _json_loads(cache_path.read_bytes())
+            if entry["source"] == [stat.st_mtime_ns, stat.st_size]:
+                return entry["data"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing, unreadable or old-format cache - parse the YAML
+        
+        return _NOT_PREBUILT
+    
+    def _load_yaml_section(self, filename: str, top_key: str) -> Any:
+        """
+        Load a single top-level section of a YAML file.
+        
+        Uses a current JSON mirror or parse cache entry when there is one.
+        Otherwise only the lines from "<top_key>:" up to the next top-level
+        key are parsed. Falls back to a full parse on any structural surprise
+        (key not at column 0, flow-style document, parse error).
+        
+        Args:
+            filename: Name of the YAML file (e.g., "thresholds.yaml")
+            top_key: Top-level key to extract (e.g., "cooldowns")
+            
+        Returns:
+            Value of top_key, or None if the file doesn't define it
+        """
+        file_path = self.config_dir / filename
+        
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {file_path}") from None
+        
+        # A mirror or cache entry beats even a partial parse, and keeps the
+        # answer the same as a full load's
+        data = self._load_prebuilt(file_path, stat)
+        if data is not _NOT_PREBUILT:
+            return (data or {}).get(top_key)
+        
+        raw = file_path.read_bytes()
+        
+        key_pattern = b"^" + re.escape(top_key.encode("utf-8")) + b":"
+        section = re.search(key_pattern, raw, re.MULTILINE)
+        if section is not None:
+            # Section ends at the next line starting in column 0
+            line_end = raw.find(b"\n", section.end())
+            next_key = _TOP_LEVEL_LINE.search(raw, line_end + 1) if line_end != -1 else None
+            end = next_key.start() if next_key else len(raw)
+            try:
+                data = yaml.load(raw[section.start():end], Loader=_Loader)
+            except yaml.YAMLError:
+                data = None
+            if isinstance(data, dict) and top_key in data:
+                return data[top_key]
+        
+        return (self._load_yaml(filename) or {}).get(top_key)
+    
+    @staticmethod
+    def _cache_name(filename: str, parse: Callable[[BinaryIO], Any]) -> str:
+        """
+        Name of the cache file for filename as parsed by parse.
+        
+        Custom parsers return partial documents, so each gets its own cache
+        file rather than sharing the full-document one.
+        """
+        if parse is _parse_yaml:
+            return filename + ".json"
+        return f"{filename}.{parse.__name__.lstrip('_')}.json"
+    
+    def _write_cache(self, cache_path: Path, source_key: List[int], data: Any) -> None:
+        """
+        Atomically write parsed config data to its JSON cache file.
+        
+        Failures are ignored; the cache is purely an optimisation. Data that
+        doesn't survive a JSON round trip unchanged is not cached.
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        Args:
+            cache_path: Destination of the JSON cache file
+            source_key: [st_mtime_ns, st_size] of the parsed YAML file
+            data: Parsed YAML data to cache
+        """
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            payload = _json_dumps({"source": source_key, "data": data})
+            # e.g. non-string keys come back as strings, NaN never compares equal
+            if _json_loads(payload)["data"] != data:
+                return
+            cache_path.parent.mkdir(exist_ok=True)
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            # Read-only config dir or YAML types JSON can't represent
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    @cached_property
+    def _combined(self) -> Optional[Dict[str, Any]]:
+        """Contents of config.yaml, or None when using per-section files."""
+        if not (self.config_dir / COMBINED_CONFIG_FILE).exists():
+            return None
+        return self._load_yaml(COMBINED_CONFIG_FILE) or {}
+    
+    def _in_combined(self, section: str) -> bool:
+        """Whether section comes from config.yaml rather than its own file."""
+        return self._combined is not None and section in self._combined
     
     def _load_sources(self) -> List[Source]:
         """
@@ -76,18 +576,22 @@ class Config:
         Returns:
             List of Source objects
         """
-        data = self._load_yaml("sources.yaml")
+        if self._in_combined("sources"):
+            entries = self._combined["sources"] or []
+        else:
+            entries = self._load_yaml("sources.yaml").get("sources", [])
         sources = []
         
-        for source_data in data.get("sources", []):
+        for source_data in entries:
             try:
                 source = Source(
                     name=source_data["name"],
-                    type=source_data["type"],
+                    # Small shared vocabularies - intern so compares are by identity
+                    type=_intern(source_data["type"]),
                     url=source_data["url"],
-                    parser_key=source_data["parser_key"],
+                    parser_key=_intern(source_data["parser_key"]),
                     poll_interval=source_data["poll_interval"],
-                    tags=source_data.get("tags", []),
+                    tags=[_intern(t) for t in source_data.get("tags") or []],
                     enabled=source_data.get("enabled", True),
                     description=source_data.get("description"),
                 )
@@ -105,12 +609,11 @@ class Config:
         Returns:
             Dictionary with 'allowlist' and 'blocklist' keys
         """
-        data = self._load_yaml("keywords.yaml")
+        if self._in_combined("keywords"):
+            return _lower_keyword_lists(self._combined["keywords"] or {})
         
-        return {
-            "allowlist": [kw.lower() for kw in data.get("allowlist", [])],
-            "blocklist": [kw.lower() for kw in data.get("blocklist", [])],
-        }
+        data = self._load_yaml("keywords.yaml", parse=_parse_keyword_lists)
+        return _lower_keyword_lists(data)
     
     def _load_routing(self) -> Dict[str, Any]:
         """
@@ -119,7 +622,9 @@ class Config:
         Returns:
             Dictionary mapping alert types to channel configs
         """
-        return self._load_yaml("routing.yaml").get("routing", {})
+        if self._in_combined("routing"):
+            return _intern_keys(self._combined["routing"] or {})
+        return _intern_keys(self._load_yaml("routing.yaml").get("routing") or {})
     
     def _load_thresholds(self) -> Dict[str, Any]:
         """
@@ -128,11 +633,71 @@ class Config:
         Returns:
             Dictionary with cooldowns, thresholds, and filters
         """
-        return self._load_yaml("thresholds.yaml")
+        if self._in_combined("thresholds"):
+            thresholds = _intern_keys(self._combined["thresholds"] or {})
+        else:
+            thresholds = _intern_keys(self._load_yaml("thresholds.yaml") or {})
+        
+        # Cooldowns are already parsed here; seed get_cooldown's table
+        self._cooldowns = thresholds.get("cooldowns") or {}
+        return thresholds
+    
+    # Lookup indexes so the accessors below never rescan the source list
+    
+    @cached_property
+    def _by_name(self) -> Dict[str, Source]:
+        by_name = {}
+        for source in self.sources:
+            by_name.setdefault(source.name, source)  # First definition wins
+        return by_name
+    
+    @cached_property
+    def _by_type(self) -> Dict[str, List[Source]]:
+        by_type = defaultdict(list)
+        for source in self.sources:
+            by_type[source.type].append(source)
+        return dict(by_type)
+    
+    @cached_property
+    def _enabled_sources(self) -> tuple:
+        return tuple(s for s in self.sources if s.enabled)
+    
+    @cached_property
+    def source_heap(self) -> List[Tuple[float, int, Source]]:
+        """
+        Enabled sources as a min-heap of (next_poll_at, index, source).
+        
+        The index breaks ties so Source objects are never compared.
+        """
+        heap = [(s.next_poll_at, i, s) for i, s in enumerate(self._enabled_sources)]
+        heapq.heapify(heap)
+        return heap
+    
+    def next_due(self, current_time: float) -> Optional[Source]:
+        """
+        Pop the enabled source whose poll is most overdue, if any.
+        
+        The returned source is rescheduled for current_time + poll_interval,
+        so a poller can loop until this returns None.
+        
+        Args:
+            current_time: Current unix timestamp
+            
+        Returns:
+            Source due for polling, or None if nothing is due yet
+        """
+        heap = self.source_heap
+        if not heap or heap[0][0] > current_time:
+            return None
+        
+        _, index, source = heap[0]
+        source.mark_polled(current_time)
+        heapq.heapreplace(heap, (source.next_poll_at, index, source))
+        return source
     
     def get_enabled_sources(self) -> List[Source]:
         """Get only enabled sources."""
-        return [s for s in self.sources if s.enabled]
+        return list(self._enabled_sources)
     
     def get_source_by_name(self, name: str) -> Source:
         """
@@ -147,14 +712,14 @@ class Config:
         Raises:
             KeyError: If source not found
         """
-        for source in self.sources:
-            if source.name == name:
-                return source
-        raise KeyError(f"Source not found: {name}")
+        try:
+            return self._by_name[name]
+        except KeyError:
+            raise KeyError(f"Source not found: {name}") from None
     
     def get_sources_by_type(self, source_type: str) -> List[Source]:
         """Get all sources of a specific type."""
-        return [s for s in self.sources if s.type == source_type]
+        return list(self._by_type.get(source_type, ()))
     
     def has_keyword_match(self, text: str) -> bool:
         """
@@ -166,19 +731,24 @@ class Config:
         Returns:
             True if text matches filter criteria
         """
-        text_lower = text.lower()
-        
-        # Check blocklist first (faster rejection)
-        for blocked_word in self.keywords["blocklist"]:
-            if blocked_word in text_lower:
-                return False
-        
-        # Check allowlist
-        for allowed_word in self.keywords["allowlist"]:
-            if allowed_word in text_lower:
-                return True
+        return self._match_lowered(text.lower())
+    
+    def has_keyword_match_many(self, texts: List[str]) -> List[bool]:
+        """
+        Batch version of has_keyword_match for large result sets.
         
-        return False
+        Args:
+            texts: Texts to check (e.g., every product title on a page)
+            
+        Returns:
+            List of match results in the same order as texts
+        """
+        return list(map(self._match_lowered, map(str.lower, texts)))
+    
+    @cached_property
+    def _match_lowered(self) -> Callable[[str], bool]:
+        """Keyword matcher for already-lowercased text, built on first use."""
+        return _build_matcher(self.keywords["allowlist"], self.keywords["blocklist"])
     
     def get_cooldown(self, alert_type: str) -> int:
         """
@@ -190,7 +760,14 @@ class Config:
         Returns:
             Cooldown in seconds (0 = no cooldown)
         """
-        return self.thresholds.get("cooldowns", {}).get(alert_type, 0)
+        return self._cooldowns.get(alert_type, 0)
+    
+    @cached_property
+    def _cooldowns(self) -> Dict[str, int]:
+        """Cooldown table, parsed on first use from its own section."""
+        if self._in_combined("thresholds"):
+            return _intern_keys((self._combined["thresholds"] or {}).get("cooldowns") or {})
+        return _intern_keys(self._load_yaml_section("thresholds.yaml", "cooldowns") or {})
     
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -202,10 +779,23 @@ def load_config(config_dir: Path = None) -> Config:
     """
     Convenience function to load configuration.
     
+    Config is treated as immutable for the life of the process, so repeated
+    calls for the same directory return the same object. Use
+    load_config.cache_clear() to force a reload.
+    
     Args:
         config_dir: Optional path to config directory
         
     Returns:
         Configured Config object
     """
-    return Config(config_dir=config_dir)
+    return _load_config_cached(str(config_dir) if config_dir else "")
+
+
+@lru_cache(maxsize=None)
+def _load_config_cached(config_key: str) -> Config:
+    """Build a Config for a normalised directory key ("" = default)."""
+    return Config(config_dir=Path(config_key) if config_key else None)
+
+
+load_config.cache_clear = _load_config_cached.cache_clear
@@ -6,8 +6,10 @@ Represents a monitoring target (website, API, etc).
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+_VALID_TYPES = frozenset({"retail_category", "event_list", "event_vendor"})
 
-@dataclass
+
+@dataclass(slots=True)
 class Source:
     """Configuration for a single monitoring source."""
     
@@ -19,6 +21,7 @@ class Source:
     tags: List[str] = field(default_factory=list)  # ["retailer", "ireland", etc]
     enabled: bool = True                # Whether to actively monitor
     description: Optional[str] = None   # Human-readable description
+    next_poll_at: float = field(default=0.0, compare=False)  # Unix time the next poll is due
     
     def __post_init__(self):
         """Validate the source configuration."""
@@ -28,31 +31,32 @@ class Source:
         if not self.url:
             raise ValueError(f"URL is required for source: {self.name}")
         
-        if self.type not in ["retail_category", "event_list", "event_vendor"]:
+        if self.type not in _VALID_TYPES:
             raise ValueError(f"Invalid source type '{self.type}' for {self.name}")
         
         if self.poll_interval < 60:
             raise ValueError(f"Poll interval too short for {self.name} (min 60 seconds)")
     
-    def should_poll(self, last_poll_time: float, current_time: float) -> bool:
+    def is_due(self, current_time: float) -> bool:
         """
         Check if this source is due for polling.
         
         Args:
-            last_poll_time: Unix timestamp of last poll
             current_time: Current unix timestamp
             
         Returns:
-            True if enough time has elapsed since last poll
+            True if the source is enabled and its next poll time has passed
         """
-        if not self.enabled:
-            return False
-        
-        if last_poll_time is None:
-            return True
+        return self.enabled and current_time >= self.next_poll_at
+    
+    def mark_polled(self, current_time: float) -> None:
+        """
+        Record a completed poll and schedule the next one.
         
-        elapsed = current_time - last_poll_time
-        return elapsed >= self.poll_interval
+        Args:
+            current_time: Unix timestamp of the completed poll
+        """
+        self.next_poll_at = current_time + self.poll_interval
     
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -0,0 +1,389 @@
+"""Tests for the configuration loader."""
+
+import datetime
+import io
+import os
+
+import pytest
+
+from src import config_loader
+from src.config_loader import Config
+
+
+SOURCES_YAML = """\
+sources:
+  - name: shop_a
+    type: retail_category
+    url: https://a.example/pokemon
+    parser_key: shopify_collection
+    poll_interval: 300
+    tags: [ireland, 2026]
+  - name: shop_b
+    type: retail_category
+    url: https://b.example/pokemon
+    parser_key: shopify_collection
+    poll_interval: 600
+    tags:
+  - name: shop_off
+    type: retail_category
+    url: https://c.example/pokemon
+    parser_key: shopify_collection
+    poll_interval: 60
+    enabled: false
+"""
+
+KEYWORDS_YAML = """\
+allowlist:
+  - Pokémon
+  - pokemon
+  - ETB
+  -
+  - ~
+blocklist:
+  - plush
+  - ""
+"""
+
+ROUTING_YAML = """\
+routing:
+  stock_in:
+    telegram: true
+    discord: stock_alerts
+"""
+
+THRESHOLDS_YAML = """\
+cooldowns:
+  stock_in: 3600
+  price_drop: 43200
+season_start: 2026-03-01
+hard_cap: .inf
+by_id:
+  1: 5
+"""
+
+
+@pytest.fixture(autouse=True)
+def no_project_env(monkeypatch):
+    """Keep Config() from reading the developer's real project .env."""
+    monkeypatch.setattr(config_loader, "_env_loaded", True)
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """A config directory with one small file per section."""
+    (tmp_path / "sources.yaml").write_text(SOURCES_YAML, encoding="utf-8")
+    (tmp_path / "keywords.yaml").write_text(KEYWORDS_YAML, encoding="utf-8")
+    (tmp_path / "routing.yaml").write_text(ROUTING_YAML, encoding="utf-8")
+    (tmp_path / "thresholds.yaml").write_text(THRESHOLDS_YAML, encoding="utf-8")
+    return tmp_path
+
+
+# Keyword matching
+
+KEYWORDS = config_loader._lower_keyword_lists({
+    "allowlist": ["Pokémon", "pokemon", "Elite Trainer Box", "", None],
+    "blocklist": ["", "Plush", "yu-gi-oh"],
+})
+
+TITLES = [
+    "",
+    "Pokémon Booster Box",
+    "POKÉMON ETB",
+    "pokemon plush",
+    "Yu-Gi-Oh Pokemon crossover",
+    "Elite Trainer Box",
+    "Magic The Gathering",
+]
+
+
+def _expected(text, keywords):
+    text = text.lower()
+    if any(kw in text for kw in keywords["blocklist"]):
+        return False
+    return any(kw in text for kw in keywords["allowlist"])
+
+
+@pytest.fixture(params=["inline", "ahocorasick", "regex"])
+def build_matcher(request, monkeypatch):
+    """_build_matcher forced onto a single backend."""
+    if request.param == "inline":
+        monkeypatch.setattr(config_loader, "_INLINE_KEYWORD_LIMIT", 10**6)
+    else:
+        monkeypatch.setattr(config_loader, "_INLINE_KEYWORD_LIMIT", -1)
+    if request.param == "ahocorasick" and config_loader.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    if request.param == "regex":
+        monkeypatch.setattr(config_loader, "ahocorasick", None)
+    return config_loader._build_matcher
+
+
+def test_lower_keyword_lists_drops_empty_keywords():
+    assert KEYWORDS == {
+        "allowlist": ["pokémon", "pokemon", "elite trainer box"],
+        "blocklist": ["plush", "yu-gi-oh"],
+    }
+
+
+def test_matcher_backends_agree(build_matcher):
+    match = build_matcher(KEYWORDS["allowlist"], KEYWORDS["blocklist"])
+    for title in TITLES:
+        assert match(title.lower()) == _expected(title, KEYWORDS), title
+
+
+def test_matcher_with_only_empty_keywords(build_matcher):
+    keywords = config_loader._lower_keyword_lists({"allowlist": [""], "blocklist": [""]})
+    match = build_matcher(keywords["allowlist"], keywords["blocklist"])
+    assert [match(t.lower()) for t in TITLES] == [False] * len(TITLES)
+
+
+def test_inline_matcher_quotes_keywords():
+    match = config_loader._compile_inline_matcher(["it's \"ok\"\\n"], ["x\ny"])
+    assert match("it's \"ok\"\\n")
+    assert not match("it's \"ok\"\\n x\ny")
+
+
+def test_has_keyword_match_many(config_dir):
+    config = Config(config_dir)
+    titles = ["Pokémon ETB", "POKEMON PLUSH", "Nothing here", "null"]
+    assert config.has_keyword_match_many(titles) == [True, False, False, False]
+    assert [config.has_keyword_match(t) for t in titles] == [True, False, False, False]
+
+
+# keywords.yaml event-stream parser
+
+def test_parse_keyword_lists_skips_nulls():
+    doc = b'allowlist:\n  - \n  - ~\n  - null\n  - "null"\n  - Poke\nblocklist: [~, X]\n'
+    assert config_loader._parse_keyword_lists(io.BytesIO(doc)) == {
+        "allowlist": ["null", "Poke"],
+        "blocklist": ["X"],
+    }
+
+
+def test_parse_keyword_lists_ignores_other_keys():
+    doc = b"meta:\n  allowlist: [nope]\nallowlist:\n  - Foo\n  - [bar]\nother: [baz]\n"
+    assert config_loader._parse_keyword_lists(io.BytesIO(doc)) == {
+        "allowlist": ["Foo"],
+        "blocklist": [],
+    }
+
+
+def test_parse_keyword_lists_resolves_aliases():
+    doc = b"shared: &kw [Q]\nallowlist: *kw\nblocklist: []\n"
+    assert config_loader._parse_keyword_lists(io.BytesIO(doc)) == {
+        "allowlist": ["Q"],
+        "blocklist": [],
+    }
+
+
+def test_keywords_match_combined_file(config_dir, tmp_path_factory):
+    combined_dir = tmp_path_factory.mktemp("combined")
+    keywords = "".join("  " + line + "\n" for line in KEYWORDS_YAML.splitlines())
+    (combined_dir / "config.yaml").write_text("keywords:\n" + keywords, encoding="utf-8")
+    assert Config(combined_dir).keywords == Config(config_dir).keywords
+
+
+def test_numeric_keywords_agree_across_paths(tmp_path_factory):
+    keywords = "allowlist:\n  - 151\n  - 1.50\n  - Pokemon\nblocklist: []\n"
+    per_file = tmp_path_factory.mktemp("per_file")
+    (per_file / "keywords.yaml").write_text(keywords, encoding="utf-8")
+    combined = tmp_path_factory.mktemp("combined")
+    indented = "".join("  " + line + "\n" for line in keywords.splitlines())
+    (combined / "config.yaml").write_text("keywords:\n" + indented, encoding="utf-8")
+
+    expected = {"allowlist": ["151", "1.5", "pokemon"], "blocklist": []}
+    assert Config(per_file).keywords == expected
+    assert Config(combined).keywords == expected
+
+
+def test_keyword_cache_is_separate_from_full_document(config_dir):
+    config = Config(config_dir)
+    config.keywords
+    assert config._load_yaml("keywords.yaml")["allowlist"][0] == "Pokémon"
+
+
+# JSON parse cache
+
+def test_cold_and_warm_loads_match(config_dir):
+    cold = Config(config_dir)
+    cold_values = (cold.sources, cold.keywords, cold.routing, cold.thresholds)
+    warm = Config(config_dir)
+    warm_values = (warm.sources, warm.keywords, warm.routing, warm.thresholds)
+
+    assert warm_values == cold_values
+    assert warm.thresholds["season_start"] == datetime.date(2026, 3, 1)
+    assert warm.thresholds["hard_cap"] == float("inf")
+    assert warm.thresholds["by_id"] == {1: 5}
+
+
+def test_cache_skips_lossy_documents(config_dir):
+    Config(config_dir).thresholds
+    Config(config_dir).routing
+    cache_dir = config_dir / ".cache"
+    assert (cache_dir / "routing.yaml.json").exists()
+    assert not (cache_dir / "thresholds.yaml.json").exists()
+
+
+def test_cache_rejects_edit_with_restored_mtime(config_dir):
+    routing_path = config_dir / "routing.yaml"
+    assert Config(config_dir).routing["stock_in"]["discord"] == "stock_alerts"
+
+    stat = routing_path.stat()
+    routing_path.write_text(ROUTING_YAML.replace("stock_alerts", "restocks"), encoding="utf-8")
+    os.utime(routing_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert Config(config_dir).routing["stock_in"]["discord"] == "restocks"
+
+
+def test_json_mirror_is_preferred(config_dir):
+    (config_dir / "routing.yaml.json").write_text(
+        '{"routing": {"stock_in": {"discord": "mirror"}}}', encoding="utf-8")
+    assert Config(config_dir).routing == {"stock_in": {"discord": "mirror"}}
+
+
+def test_get_cooldown_uses_json_mirror(config_dir):
+    (config_dir / "thresholds.yaml.json").write_text(
+        '{"cooldowns": {"stock_in": 99}}', encoding="utf-8")
+    assert Config(config_dir).get_cooldown("stock_in") == 99
+
+    config = Config(config_dir)
+    config.thresholds
+    assert config.get_cooldown("stock_in") == 99
+
+
+def test_get_cooldown_uses_parse_cache(config_dir):
+    stat = (config_dir / "thresholds.yaml").stat()
+    (config_dir / ".cache").mkdir()
+    (config_dir / ".cache" / "thresholds.yaml.json").write_text(
+        '{"source": [%d, %d], "data": {"cooldowns": {"stock_in": 99}}}'
+        % (stat.st_mtime_ns, stat.st_size), encoding="utf-8")
+    assert Config(config_dir).get_cooldown("stock_in") == 99
+
+
+# Combined config.yaml
+
+def test_combined_file_falls_back_per_section(config_dir):
+    (config_dir / "config.yaml").write_text(
+        "routing:\n  stock_in:\n    telegram: false\n", encoding="utf-8")
+    config = Config(config_dir)
+    assert config.routing == {"stock_in": {"telegram": False}}
+    assert config.keywords["allowlist"] == ["pokémon", "pokemon", "etb"]
+    assert config.get_cooldown("stock_in") == 3600
+    assert [s.name for s in config.sources] == ["shop_a", "shop_b", "shop_off"]
+
+
+def test_combined_file_section_wins(config_dir):
+    (config_dir / "config.yaml").write_text(
+        "thresholds:\n  cooldowns:\n    stock_in: 5\nsources: []\n", encoding="utf-8")
+    config = Config(config_dir)
+    assert config.get_cooldown("stock_in") == 5
+    assert config.sources == []
+    assert config.thresholds == {"cooldowns": {"stock_in": 5}}
+
+
+# Section slicing
+
+@pytest.mark.parametrize("document", [
+    b"cooldowns:\n  stock_in: 60\nother: 1\n",
+    b"cooldowns:\r\n  stock_in: 60\r\nother: 1\r\n",
+    b"other: 1\ncooldowns:\n  stock_in: 60",
+    b"{cooldowns: {stock_in: 60}, other: 1}\n",
+    b"base: &b {stock_in: 60}\ncooldowns: *b\n",
+    b"# header\n---\ncooldowns:\n  # comment\n  stock_in: 60\n\n# trailer\nother: 1\n",
+])
+def test_load_yaml_section(tmp_path, document):
+    (tmp_path / "thresholds.yaml").write_bytes(document)
+    config = Config(tmp_path)
+    assert config._load_yaml_section("thresholds.yaml", "cooldowns") == {"stock_in": 60}
+
+
+def test_load_yaml_section_missing_key(tmp_path):
+    (tmp_path / "thresholds.yaml").write_bytes(b"other: 1\n")
+    assert Config(tmp_path)._load_yaml_section("thresholds.yaml", "cooldowns") is None
+
+
+def test_get_cooldown(config_dir):
+    config = Config(config_dir)
+    assert config.get_cooldown("stock_in") == 3600
+    assert config.get_cooldown("unknown") == 0
+
+
+@pytest.mark.parametrize("document, expected", [
+    (b"allowed:\n- Louth\n- Meath\nother: 1\n", ["Louth", "Meath"]),
+    (b"allowed:\r\n- Louth\r\n-\r\n- Meath\r\n", ["Louth", None, "Meath"]),
+    (b"other: 1\nallowed:\n  - Louth\n  - Meath\n---\n", ["Louth", "Meath"]),
+])
+def test_load_yaml_section_column_zero_sequence(tmp_path, document, expected):
+    (tmp_path / "thresholds.yaml").write_bytes(document)
+    config = Config(tmp_path)
+    assert config._load_yaml_section("thresholds.yaml", "allowed") == expected
+
+
+# Sources
+
+def test_sources_keep_empty_and_non_string_tags(config_dir):
+    config = Config(config_dir)
+    assert config.get_source_by_name("shop_a").tags == ["ireland", 2026]
+    assert config.get_source_by_name("shop_b").tags == []
+    with pytest.raises(KeyError):
+        config.get_source_by_name("missing")
+
+
+def test_next_due(config_dir):
+    config = Config(config_dir)
+
+    due = [config.next_due(0), config.next_due(0), config.next_due(0)]
+    assert [s.name for s in due[:2]] == ["shop_a", "shop_b"]
+    assert due[2] is None  # Disabled sources are never scheduled
+
+    assert config.next_due(299) is None
+    assert config.next_due(300).name == "shop_a"
+    assert config.next_due(600).name == "shop_a"
+    assert config.next_due(600).name == "shop_b"
+    assert config.next_due(600) is None
+
+
+# .env parsing
+
+@pytest.mark.parametrize("raw, expected", [
+    (b"DEBUG", b"DEBUG"),
+    (b"DEBUG  # verbose", b"DEBUG"),
+    (b" # c", b""),
+    (b'"123" # chat', b"123"),
+    (b" '123'", b"123"),
+    (b"'x # y'  # c", b"x # y"),
+    (b"'a\\nb'", b"a\\nb"),
+    (b'"say \\"hi\\""', b'say "hi"'),
+    (b'"a\\nb"', b"a\nb"),
+    (b'"a\\\\b"', b"a\\b"),
+    (b"plain#notcomment", b"plain#notcomment"),
+    (b"${HOME}/x", b"${HOME}/x"),
+    (b"", b""),
+])
+def test_parse_env_value(raw, expected):
+    assert config_loader._parse_env_value(raw) == expected
+
+
+def test_load_env_once(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_bytes(
+        b"# comment\n"
+        b"TCG_TEST_LEVEL=DEBUG  # verbose\r\n"
+        b"export TCG_TEST_CHAT=\"123\" # chat\n"
+        b"TCG_TEST_HOOK= # not used yet\n"
+        b"TCG_TEST_SET=from_file\n"
+        b"not a pair\n"
+    )
+    monkeypatch.setattr(config_loader, "_ENV_FILE", env_file)
+    monkeypatch.setattr(config_loader, "_env_loaded", False)
+    for key in ("TCG_TEST_LEVEL", "TCG_TEST_CHAT", "TCG_TEST_HOOK"):
+        # setenv first so monkeypatch restores (removes) what the load sets
+        monkeypatch.setenv(key, "")
+        monkeypatch.delenv(key)
+    monkeypatch.setenv("TCG_TEST_SET", "from_env")
+
+    config_loader._load_env_once()
+
+    assert os.environ["TCG_TEST_LEVEL"] == "DEBUG"
+    assert os.environ["TCG_TEST_CHAT"] == "123"
+    assert os.environ["TCG_TEST_HOOK"] == ""
+    assert os.environ["TCG_TEST_SET"] == "from_env"